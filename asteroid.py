@@ -10,9 +10,6 @@ class Asteroid(CircleShape):
     def draw(self, screen):
         pygame.draw.circle(screen, "white", self.position, self.radius, width=2)
 
-    def update(self, dt):
-        self.position += self.velocity * dt
-
     def split(self):
         self.kill()
 
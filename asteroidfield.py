@@ -28,8 +28,11 @@ class AsteroidField(pygame.sprite.Sprite):
         ],
     ]
 
-    def __init__(self):
+    def __init__(self, asteroids):
         pygame.sprite.Sprite.__init__(self, self.containers)
+        # group of asteroids this field moves; Asteroid has no update() of
+        # its own, so this field is the only thing that moves asteroids
+        self.asteroids = asteroids
         self.spawn_timer = 0.0
 
     def spawn(self, radius, position, velocity):
@@ -37,6 +40,10 @@ class AsteroidField(pygame.sprite.Sprite):
         asteroid.velocity = velocity
 
     def update(self, dt):
+        # move all asteroids in one loop instead of one update() call each
+        for asteroid in self.asteroids.sprites():
+            asteroid.position += asteroid.velocity * dt
+
         self.spawn_timer += dt
         if self.spawn_timer > ASTEROID_SPAWN_RATE:
             self.spawn_timer = 0
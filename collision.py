@@ -0,0 +1,139 @@
+import math
+
+import numpy as np
+
+# numba is optional; without it the broad phase is vectorized with NumPy
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Asteroid x shot pairs above which the spatial hash beats the dense scan
+_GRID_MIN_PAIRS = 2048
+
+
+class CircleArrays:
+    """Reusable SoA buffers holding the x, y and radius of circle sprites."""
+
+    def __init__(self, capacity=64):
+        self._data = np.empty((3, capacity), dtype=np.float64)
+
+    def load(self, sprites):
+        """Copy the sprites' positions and radii in and return (x, y, r) views."""
+        n = len(sprites)
+        if n > self._data.shape[1]:
+            self._data = np.empty((3, max(n, 2 * self._data.shape[1])), dtype=np.float64)
+
+        data = self._data
+        data[0, :n] = [s.position.x for s in sprites]
+        data[1, :n] = [s.position.y for s in sprites]
+        data[2, :n] = [s.radius for s in sprites]
+        return data[0, :n], data[1, :n], data[2, :n]
+
+
+def _shot_hits(apx, apy, ar, spx, spy, sr):
+    """Return (asteroid index, shot index) pairs whose circles overlap."""
+    hits = []
+    for i in range(apx.shape[0]):
+        for j in range(spx.shape[0]):
+            dx = apx[i] - spx[j]
+            dy = apy[i] - spy[j]
+            rs = ar[i] + sr[j]
+            if dx * dx + dy * dy <= rs * rs:
+                hits.append((i, j))
+    return hits
+
+
+def _shot_hits_grid(apx, apy, ar, spx, spy, sr):
+    """Spatial-hash variant of _shot_hits for large asteroid and shot counts.
+
+    Asteroids are bucketed into grid cells at least as wide as the largest
+    asteroid and shot radii combined, so each shot only has to test the
+    asteroids in its own cell and the 8 around it. Cells are hashed into a
+    table sized to the asteroid count because asteroids drift off screen
+    without bound.
+    """
+    n = apx.shape[0]
+    cell = ar.max() + sr.max()
+    size = 1
+    while size < 2 * n:
+        size *= 2
+    mask = size - 1
+
+    # Counting sort of asteroid indices by hashed cell
+    keys = np.empty(n, dtype=np.int64)
+    starts = np.zeros(size + 1, dtype=np.int64)
+    for i in range(n):
+        gx = int(math.floor(apx[i] / cell))
+        gy = int(math.floor(apy[i] / cell))
+        keys[i] = ((gx * 73856093) ^ (gy * 19349663)) & mask
+        starts[keys[i] + 1] += 1
+    for k in range(size):
+        starts[k + 1] += starts[k]
+    order = np.empty(n, dtype=np.int64)
+    fill = starts[:-1].copy()
+    for i in range(n):
+        order[fill[keys[i]]] = i
+        fill[keys[i]] += 1
+
+    hits = []
+    seen = np.empty(9, dtype=np.int64)
+    for j in range(spx.shape[0]):
+        cx = int(math.floor(spx[j] / cell))
+        cy = int(math.floor(spy[j] / cell))
+        n_seen = 0
+        for gx in range(cx - 1, cx + 2):
+            for gy in range(cy - 1, cy + 2):
+                k = ((gx * 73856093) ^ (gy * 19349663)) & mask
+
+                # Neighbouring cells can hash to the same bucket; scan it once
+                duplicate = False
+                for m in range(n_seen):
+                    if seen[m] == k:
+                        duplicate = True
+                if duplicate:
+                    continue
+                seen[n_seen] = k
+                n_seen += 1
+
+                for m in range(starts[k], starts[k + 1]):
+                    i = order[m]
+                    dx = apx[i] - spx[j]
+                    dy = apy[i] - spy[j]
+                    rs = ar[i] + sr[j]
+                    if dx * dx + dy * dy <= rs * rs:
+                        hits.append((i, j))
+    return hits
+
+
+def _shot_hits_vectorized(apx, apy, ar, spx, spy, sr):
+    """NumPy broadcast equivalent of _shot_hits for when numba is unavailable."""
+    dx = apx[:, None] - spx[None, :]
+    dy = apy[:, None] - spy[None, :]
+    rs = ar[:, None] + sr[None, :]
+    return np.argwhere(dx * dx + dy * dy <= rs * rs).tolist()
+
+
+if njit is not None:
+    _shot_hits_dense = njit(cache=True, fastmath=True)(_shot_hits)
+    _shot_hits_sparse = njit(cache=True, fastmath=True)(_shot_hits_grid)
+
+    def shot_hits(apx, apy, ar, spx, spy, sr):
+        """Return (asteroid index, shot index) pairs whose circles overlap."""
+        if apx.shape[0] * spx.shape[0] >= _GRID_MIN_PAIRS:
+            return _shot_hits_sparse(apx, apy, ar, spx, spy, sr)
+        return _shot_hits_dense(apx, apy, ar, spx, spy, sr)
+
+    def warm_up():
+        """Compile (or load from cache) the kernels before the game loop starts."""
+        one = np.ones(1, dtype=np.float64)
+        _shot_hits_dense(one, one, one, one, one, one)
+        _shot_hits_sparse(one, one, one, one, one, one)
+
+else:
+    # The grid kernel is only worth it compiled; NumPy's dense scan is faster
+    # than running it as plain Python at the counts this game reaches
+    shot_hits = _shot_hits_vectorized
+
+    def warm_up():
+        """Nothing to compile without numba."""
@@ -6,159 +6,262 @@ Files:
 - game_state.jsonl: One JSON object per line, sampled ~1/sec up to _MAX_SECONDS.
   Example entry:
     {"timestamp":"12:34:56.789","elapsed_s":3,"frame":180,"screen_size":[1280,720],
-     "updatable":{"count":12,"sprites":[{"type":"Asteroid","pos":[10.5,20.0],"vel":[1.2,-0.3],"rad":16},{"type":"Player","pos":[640.0,360.0],"rot":45.0}]}}
+     "updatable":{"count":2,"sprites":[{"type":"AsteroidField"},{"type":"Player","pos":[640.0,360.0],"rot":45.0}]},
+     "asteroids":{"count":1,"sprites":[{"type":"Asteroid","pos":[10.5,20.0],"vel":[1.2,-0.3],"rad":20}]}}
 - game_events.jsonl: One JSON object per line per event.
   Example entry:
     {"timestamp":"12:34:59.012","elapsed_s":6,"frame":360,"type":"shot_hit","asteroid_size":16}
 
 Usage:
-- Call log_state() once per frame (after updates).
-- Call log_event(type, **details) when notable events occur.
+- Call log_state(frame, **groups) once per frame (after updates).
+- Call log_event(type, frame, **details) when notable events occur.
+- Set ASTEROIDS_LOG=0 in the environment to disable both logs.
 """
 
-import inspect
+import atexit
 import json
 import math
+import os
+import queue
+import threading
+import time
 from datetime import datetime
+from functools import partial
+
+from constants import SCREEN_HEIGHT, SCREEN_WIDTH
+
+# orjson is optional; fall back to the stdlib encoder when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+
+    def _dumps_line(obj):
+        """Serialize obj to one compact, newline-terminated line of JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+
+else:
+
+    def _dumps_line(obj):
+        """Serialize obj to one compact, newline-terminated line of JSON bytes."""
+        return (json.dumps(obj, separators=(",", ":")) + "\n").encode()
+
 
 # Public API of this module
 __all__ = ["log_state", "log_event"]
 
-_FPS = 60
+_LOG_INTERVAL = 1.0  # Seconds between state snapshots
 _MAX_SECONDS = 16
 _SPRITE_SAMPLE_LIMIT = 10  # Max sprites to sample per group snapshot
-
-# Module-level state for throttling and file-init handling
-_frame_count = 0
-_state_log_initialized = False
-_event_log_initialized = False
+_EVENT_BATCH_SIZE = 32  # Events queued before they are serialized and written
+
+# Constant fragment of every state line, encoded once at import
+_SCREEN_JSON = f',"screen_size":[{SCREEN_WIDTH},{SCREEN_HEIGHT}]'
+
+# Attributes sampled for each sprite class; other classes log only their type
+_SPRITE_FIELDS = {
+    "Asteroid": ("position", "velocity", "radius"),
+    "Player": ("position", "rotation"),
+    "Shot": ("position", "velocity", "radius"),
+}
+
+# Module-level state for throttling and lazily opened log files
+_state_fp = None
+_event_fp = None
+_event_queue = []
+_write_queue = queue.SimpleQueue()  # Write jobs for the writer thread; None stops it
+_writer = None
 _start_time = datetime.now()
+_next_log_ts = 0.0  # Set by the first log_state call, when the game loop starts
+_end_log_ts = math.inf
 
 
-def log_state():
-    """Capture a lightweight snapshot of the game's state about once per second."""
-    global _frame_count, _state_log_initialized
+def _write_loop():
+    """Run queued write jobs on the writer thread until the None sentinel."""
+    while (job := _write_queue.get()) is not None:
+        job()
 
-    # Stop logging after the time budget is exceeded
-    if _frame_count > _FPS * _MAX_SECONDS:
-        return
 
-    # Advance frame counter and sample roughly once per second
-    _frame_count += 1
-    if _frame_count % _FPS != 0:
-        return
+def _submit(job):
+    """Queue a write job, starting the writer thread on first use."""
+    global _writer
 
-    now = datetime.now()
+    if _writer is None:
+        _writer = threading.Thread(target=_write_loop, name="log-writer", daemon=True)
+        _writer.start()
+    _write_queue.put(job)
 
-    # Introspect caller frame to read local variables from the game loop
-    frame = inspect.currentframe()
-    if frame is None:
-        return
 
-    frame_back = frame.f_back
-    if frame_back is None:
-        return
+def _write_events(fp, events):
+    """Serialize a batch of queued events and write it in one call."""
+    lines = []
+    for now, frame, event_type, details in events:
+        event = {
+            "timestamp": now.time().isoformat(timespec="milliseconds"),
+            "elapsed_s": math.floor((now - _start_time).total_seconds()),
+            "frame": frame,  # frame number at time of event
+            "type": event_type,
+            **details,
+        }
+        lines.append(_dumps_line(event))
+    fp.write(b"".join(lines))
+
+
+def _state_log():
+    """Return the state log file, creating it on first use."""
+    global _state_fp
 
-    local_vars = frame_back.f_locals.copy()
+    # Create file on first write and keep the handle open thereafter
+    if _state_fp is None:
+        _state_fp = open("game_state.jsonl", "wb", buffering=65536)
+    return _state_fp
 
-    screen_size = []
-    game_state = {}
 
-    # Look for pygame surfaces and sprite groups in caller locals
-    for key, value in local_vars.items():
-        # Screen surface (for dimensions)
-        if "pygame" in str(type(value)) and hasattr(value, "get_size"):
-            screen_size = value.get_size()
+def _event_log():
+    """Return the event log file, creating it on first use."""
+    global _event_fp
 
-        # Sprite groups: sample a limited number of sprites with key properties
-        if hasattr(value, "__class__") and "Group" in value.__class__.__name__:
-            sprites_data = []
+    # Create file on first write and keep the handle open thereafter
+    if _event_fp is None:
+        _event_fp = open("game_events.jsonl", "wb", buffering=65536)
+    return _event_fp
 
-            for i, sprite in enumerate(value):
-                if i >= _SPRITE_SAMPLE_LIMIT:
-                    break
 
-                sprite_info = {"type": sprite.__class__.__name__}
+def _flush_events():
+    """Hand all queued events to the writer thread as one batch."""
+    if not _event_queue:
+        return
+
+    _submit(partial(_write_events, _event_log(), _event_queue.copy()))
+    _event_queue.clear()
+
+
+def _close_logs():
+    """Flush and close any log files opened during the run."""
+    if _writer is None:
+        # Threads can't be started at interpreter shutdown, so if the writer
+        # never ran, write leftover events on this thread instead
+        if _event_queue:
+            _write_events(_event_log(), _event_queue)
+            _event_queue.clear()
+    else:
+        _flush_events()
+        _write_queue.put(None)
+        _writer.join()
+    for fp in (_state_fp, _event_fp):
+        if fp is not None:
+            fp.close()
+
+
+atexit.register(_close_logs)
+
+
+def log_state(
+    frame,
+    _monotonic=time.monotonic,
+    _now=datetime.now,
+    _floor=math.floor,
+    _r=round,
+    **groups,
+):
+    """Capture a lightweight snapshot of the game's state about once per second.
+
+    frame is the game loop's frame number and each keyword argument is a
+    named sprite group to sample, e.g. updatable=updatable. The underscore
+    parameters pre-bind hot globals as fast locals and are not meant to be
+    passed.
+    """
+    global _next_log_ts, _end_log_ts
+
+    # Sample roughly once per second of wall time
+    t = _monotonic()
+    if t < _next_log_ts:
+        return
+
+    # Start the clock on the first frame so startup time isn't counted
+    if _next_log_ts == 0.0:
+        _next_log_ts = t + _LOG_INTERVAL
+        _end_log_ts = t + _MAX_SECONDS
+        return
+
+    # Stop logging after the time budget is exceeded
+    if t > _end_log_ts:
+        _next_log_ts = math.inf
+        return
 
-                if hasattr(sprite, "position"):
-                    sprite_info["pos"] = [
-                        round(sprite.position.x, 2),
-                        round(sprite.position.y, 2),
-                    ]
+    _next_log_ts = t + _LOG_INTERVAL
 
-                if hasattr(sprite, "velocity"):
-                    sprite_info["vel"] = [
-                        round(sprite.velocity.x, 2),
-                        round(sprite.velocity.y, 2),
-                    ]
+    # Also hand queued events to the writer here, so a slow trickle of events
+    # reaches disk within a second instead of waiting for a full batch
+    _flush_events()
 
-                if hasattr(sprite, "radius"):
-                    sprite_info["rad"] = sprite.radius
+    now = _now()
 
-                if hasattr(sprite, "rotation"):
-                    sprite_info["rot"] = round(sprite.rotation, 2)
+    # The schema is fixed and every string in it is a class or group name, so
+    # the JSON line is formatted directly rather than built as a nested dict
+    parts = [
+        '{"timestamp":"',
+        now.time().isoformat(timespec="milliseconds"),
+        '","elapsed_s":',
+        str(_floor((now - _start_time).total_seconds())),
+        ',"frame":',
+        str(frame),
+        _SCREEN_JSON,
+    ]
 
-                sprites_data.append(sprite_info)
+    # Sprite groups: sample a limited number of sprites with key properties
+    for name, group in groups.items():
+        parts.append(f',"{name}":{{"count":{len(group)},"sprites":[')
 
-            game_state[key] = {"count": len(value), "sprites": sprites_data}
+        for i, sprite in enumerate(group.sprites()[:_SPRITE_SAMPLE_LIMIT]):
+            sprite_type = type(sprite).__name__
+            fields = _SPRITE_FIELDS.get(sprite_type, ())
+            if i:
+                parts.append(",")
+            parts.append(f'{{"type":"{sprite_type}"')
 
-        # If no groups found yet, allow logging of a single standalone sprite-like object
-        if len(game_state) == 0 and hasattr(value, "position"):
-            sprite_info = {"type": value.__class__.__name__}
+            if "position" in fields:
+                position = sprite.position
+                parts.append(f',"pos":[{_r(position.x, 2)},{_r(position.y, 2)}]')
 
-            sprite_info["pos"] = [
-                round(value.position.x, 2),
-                round(value.position.y, 2),
-            ]
+            if "velocity" in fields:
+                velocity = sprite.velocity
+                parts.append(f',"vel":[{_r(velocity.x, 2)},{_r(velocity.y, 2)}]')
 
-            if hasattr(value, "velocity"):
-                sprite_info["vel"] = [
-                    round(value.velocity.x, 2),
-                    round(value.velocity.y, 2),
-                ]
+            if "radius" in fields:
+                parts.append(f',"rad":{sprite.radius}')
 
-            if hasattr(value, "radius"):
-                sprite_info["rad"] = value.radius
+            if "rotation" in fields:
+                parts.append(f',"rot":{_r(sprite.rotation, 2)}')
 
-            if hasattr(value, "rotation"):
-                sprite_info["rot"] = round(value.rotation, 2)
+            parts.append("}")
 
-            game_state[key] = sprite_info
+        parts.append("]}")
 
-    # Build the JSON entry
-    entry = {
-        "timestamp": now.strftime("%H:%M:%S.%f")[:-3],  # millisecond precision
-        "elapsed_s": math.floor((now - _start_time).total_seconds()),
-        "frame": _frame_count,
-        "screen_size": screen_size,
-        **game_state,
-    }
+    parts.append("}\n")
 
-    # Create file on first write, append thereafter
-    mode = "w" if not _state_log_initialized else "a"
-    with open("game_state.jsonl", mode) as f:
-        f.write(json.dumps(entry) + "\n")
+    _submit(partial(_state_log().write, "".join(parts).encode()))
 
-    _state_log_initialized = True
 
+def log_event(event_type, frame, _now=datetime.now, **details):
+    """Append a single event with arbitrary details to the event log.
 
-def log_event(event_type, **details):
-    """Append a single event with arbitrary details to the event log."""
-    global _event_log_initialized
+    Only the raw event is recorded here; events are serialized and written
+    in batches of _EVENT_BATCH_SIZE or with the next state snapshot, and
+    anything still queued is written when the process exits. _now pre-binds datetime.now as a fast local and
+    is not meant to be passed.
+    """
+    _event_queue.append((_now(), frame, event_type, details))
+    if len(_event_queue) >= _EVENT_BATCH_SIZE:
+        _flush_events()
 
-    now = datetime.now()
 
-    event = {
-        "timestamp": now.strftime("%H:%M:%S.%f")[:-3],  # millisecond precision
-        "elapsed_s": math.floor((now - _start_time).total_seconds()),
-        "frame": _frame_count,  # frame number at time of event
-        "type": event_type,
-        **details,
-    }
+def _log_disabled(*args, **kwargs):
+    """Stand-in for log_state/log_event when logging is switched off."""
 
-    # Create file on first write, append thereafter
-    mode = "w" if not _event_log_initialized else "a"
-    with open("game_events.jsonl", mode) as f:
-        f.write(json.dumps(event) + "\n")
 
-    _event_log_initialized = True
\ No newline at end of file
+# Logging is on by default; ASTEROIDS_LOG=0 turns both entry points into no-ops
+if os.environ.get("ASTEROIDS_LOG", "1") == "0":
+    log_state = log_event = _log_disabled
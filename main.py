@@ -6,6 +6,7 @@ from player import Player
 from asteroid import Asteroid
 from asteroidfield import AsteroidField
 from shot import Shot
+from collision import CircleArrays, shot_hits, warm_up
 from logger import log_state, log_event
 
 def main():
@@ -23,16 +24,22 @@ def main():
     shots = pygame.sprite.Group()
 
     # Register containers for auto-adding new instances
-    Asteroid.containers = (asteroids, updatable, drawable)
+    Asteroid.containers = (asteroids, drawable)  # Moved by the AsteroidField
     AsteroidField.containers = updatable
-    asteroid_field = AsteroidField()  # Spawns asteroids over time
+    asteroid_field = AsteroidField(asteroids)  # Spawns and moves asteroids over time
 
     Player.containers = (updatable, drawable)
     player = Player(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2)  # Start at center
 
     Shot.containers = (shots, updatable, drawable)
 
+    # Collision buffers reused across frames
+    asteroid_arrays = CircleArrays()
+    shot_arrays = CircleArrays()
+    warm_up()  # JIT the collision kernels now, not on the first shot mid-game
+
     dt = 0  # Delta time (seconds since last frame)
+    frame = 0  # Frames simulated so far
     
     while True:
         # Handle window events (close, etc.)
@@ -42,21 +49,39 @@ def main():
         
         # Update all game objects with delta time
         updatable.update(dt)
+        frame += 1
 
         # Snapshot state ~1/sec to game_state.jsonl
-        log_state()
+        log_state(frame, updatable=updatable, asteroids=asteroids, shots=shots)
+
+        # Snapshot the groups once; collision handling kills sprites mid-loop
+        asteroid_list = asteroids.sprites()
+        shot_list = shots.sprites()
 
-        # Collision checks: player vs asteroids, shots vs asteroids
-        for asteroid in asteroids:
-            if asteroid.collision(player):
-                log_event("player_hit", hp=0)  # Record event of player hit
+        # Collision checks: player vs asteroids (inlined squared-distance test)
+        player_x, player_y = player.position
+        player_radius = player.radius
+        for asteroid in asteroid_list:
+            position = asteroid.position
+            dx = position.x - player_x
+            dy = position.y - player_y
+            rs = asteroid.radius + player_radius
+            if dx * dx + dy * dy <= rs * rs:
+                log_event("player_hit", frame, hp=0)  # Record event of player hit
                 print("Game over!")
                 sys.exit()
-            for shot in shots:
-                if asteroid.collision(shot):
-                    log_event("shot_hit", asteroid_size=asteroid.radius)  # Record shot impact
-                    shot.kill()
-                    asteroid.split()
+
+        # Shots vs asteroids: broad phase over flat position/radius arrays
+        if asteroid_list and shot_list:
+            hits = shot_hits(*asteroid_arrays.load(asteroid_list), *shot_arrays.load(shot_list))
+            for i, j in hits:
+                asteroid = asteroid_list[i]
+                shot = shot_list[j]
+                if not (asteroid.alive() and shot.alive()):
+                    continue  # Already consumed by an earlier hit this frame
+                log_event("shot_hit", frame, asteroid_size=asteroid.radius)  # Record shot impact
+                shot.kill()
+                asteroid.split()
 
         # Clear screen and draw all visible sprites
         screen.fill("black")
@@ -65,8 +90,9 @@ def main():
 
         pygame.display.flip()  # Present the frame
 
-        # Cap to 60 FPS and compute dt (in seconds)
-        dt = clock.tick(60) / 1000
+        # Cap to 60 FPS; tick() returns integer milliseconds, converted to seconds for dt
+        dt_ms = clock.tick(60)
+        dt = dt_ms * 0.001
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+import collision
+
+
+def _random_circles(rng, n, radii):
+    # spread well past the screen, including negative coordinates
+    return (
+        rng.uniform(-3000, 4000, n),
+        rng.uniform(-3000, 3000, n),
+        rng.choice(radii, n).astype(np.float64),
+    )
+
+
+def _pairs(hits):
+    return sorted((int(i), int(j)) for i, j in hits)
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_broad_phases_match_brute_force(seed):
+    rng = np.random.default_rng(seed)
+    asteroids = _random_circles(rng, rng.integers(1, 400), [20, 40, 60])
+    shots = _random_circles(rng, rng.integers(1, 60), [5])
+    expected = _pairs(collision._shot_hits(*asteroids, *shots))
+
+    assert _pairs(collision._shot_hits_grid(*asteroids, *shots)) == expected
+    assert _pairs(collision._shot_hits_vectorized(*asteroids, *shots)) == expected
+    assert _pairs(collision.shot_hits(*asteroids, *shots)) == expected
+    if collision.njit is not None:
+        assert _pairs(collision._shot_hits_dense(*asteroids, *shots)) == expected
+        assert _pairs(collision._shot_hits_sparse(*asteroids, *shots)) == expected
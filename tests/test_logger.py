@@ -0,0 +1,138 @@
+import atexit
+import importlib
+import json
+import math
+
+import pygame
+import pytest
+
+import logger as logger_module
+from asteroid import Asteroid
+from player import Player
+from shot import Shot
+
+
+@pytest.fixture
+def logger(monkeypatch, tmp_path):
+    # fresh module state, writing its logs into tmp_path; reloads in a test
+    # must not leave extra exit hooks behind
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("ASTEROIDS_LOG", raising=False)
+    monkeypatch.setattr(atexit, "register", lambda func: func)
+    module = importlib.reload(logger_module)
+    yield module
+    module._close_logs()
+
+
+def _snapshot(logger, frame, **groups):
+    # skip the once-per-second throttle so this call writes a line
+    logger._next_log_ts = -math.inf
+    logger.log_state(frame, **groups)
+
+
+def _read_lines(path):
+    with open(path, "rb") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_state_line_keeps_schema(logger, tmp_path):
+    asteroid = Asteroid(10.123, 20.456, 40)
+    asteroid.velocity = pygame.Vector2(1.234, -0.305)
+    player = Player(640, 360)
+    player.rotation = 45.678
+    shot = Shot(100.0, 200.0)
+    shot.velocity = pygame.Vector2(0, 500)
+    updatable = pygame.sprite.Group(player, shot)
+    asteroids = pygame.sprite.Group(asteroid)
+
+    _snapshot(logger, 42, updatable=updatable, asteroids=asteroids)
+    logger._close_logs()
+    [entry] = _read_lines(tmp_path / "game_state.jsonl")
+
+    # the keys and rounding json.dumps produced from the nested dict before
+    expected = {
+        "frame": 42,
+        "screen_size": [1280, 720],
+        "updatable": {
+            "count": 2,
+            "sprites": [
+                {"type": "Player", "pos": [640.0, 360.0], "rot": 45.68},
+                {"type": "Shot", "pos": [100.0, 200.0], "vel": [0.0, 500.0], "rad": 5},
+            ],
+        },
+        "asteroids": {
+            "count": 1,
+            "sprites": [
+                {"type": "Asteroid", "pos": [10.12, 20.46], "vel": [1.23, -0.3], "rad": 40},
+            ],
+        },
+    }
+    assert list(entry) == ["timestamp", "elapsed_s", "frame", "screen_size", "updatable", "asteroids"]
+    assert isinstance(entry["timestamp"], str) and len(entry["timestamp"]) == len("12:34:56.789")
+    assert isinstance(entry["elapsed_s"], int)
+    for key, value in expected.items():
+        assert entry[key] == value
+        assert json.loads(json.dumps(value)) == entry[key]
+
+
+def test_state_line_samples_limited_sprites(logger, tmp_path):
+    shots = pygame.sprite.Group(*(Shot(i, i) for i in range(logger._SPRITE_SAMPLE_LIMIT + 5)))
+
+    _snapshot(logger, 1, shots=shots)
+    logger._close_logs()
+    [entry] = _read_lines(tmp_path / "game_state.jsonl")
+
+    assert entry["shots"]["count"] == logger._SPRITE_SAMPLE_LIMIT + 5
+    assert len(entry["shots"]["sprites"]) == logger._SPRITE_SAMPLE_LIMIT
+
+
+def test_state_snapshot_flushes_queued_events(logger, tmp_path):
+    for frame in range(3):
+        logger.log_event("shot_hit", frame, asteroid_size=20)
+    assert len(logger._event_queue) == 3
+
+    _snapshot(logger, 3, asteroids=pygame.sprite.Group())
+
+    assert logger._event_queue == []
+    logger._close_logs()
+    events = _read_lines(tmp_path / "game_events.jsonl")
+    assert [event["frame"] for event in events] == [0, 1, 2]
+
+
+def test_close_writes_events_without_writer(logger, tmp_path):
+    for frame in range(logger._EVENT_BATCH_SIZE - 1):
+        logger.log_event("shot_hit", frame, asteroid_size=20)
+    assert logger._writer is None
+
+    logger._close_logs()
+
+    events = _read_lines(tmp_path / "game_events.jsonl")
+    assert [event["frame"] for event in events] == list(range(logger._EVENT_BATCH_SIZE - 1))
+    assert all(event["type"] == "shot_hit" and event["asteroid_size"] == 20 for event in events)
+
+
+def test_writer_thread_writes_valid_lines(logger, tmp_path):
+    _snapshot(logger, 1, asteroids=pygame.sprite.Group(Asteroid(1, 2, 20)))
+    n_events = logger._EVENT_BATCH_SIZE + 8
+    for frame in range(n_events):
+        logger.log_event("player_hit", frame, hp=0)
+    assert logger._writer is not None
+
+    logger._close_logs()
+
+    [state] = _read_lines(tmp_path / "game_state.jsonl")
+    assert state["frame"] == 1
+    events = _read_lines(tmp_path / "game_events.jsonl")
+    assert [event["frame"] for event in events] == list(range(n_events))
+
+
+def test_disabled_logging_is_noop(monkeypatch, logger, tmp_path):
+    monkeypatch.setenv("ASTEROIDS_LOG", "0")
+    disabled = importlib.reload(logger)
+    assert disabled.log_state is disabled.log_event is disabled._log_disabled
+
+    _snapshot(disabled, 1, asteroids=pygame.sprite.Group(Asteroid(1, 2, 20)))
+    disabled.log_event("player_hit", 1, hp=0)
+    disabled._close_logs()
+
+    assert list(tmp_path.iterdir()) == []